@@ -0,0 +1,77 @@
+"""Batched activity logging.
+
+Writing a UserActivityLog row synchronously puts an INSERT (and its fsync) on
+the request critical path. log_activity() instead appends to an in-process
+queue that a daemon thread drains with bulk_create, coalescing many single-row
+INSERTs into one multi-row statement.
+"""
+
+import queue
+import threading
+
+# Flush whenever this many entries accumulate, or on the interval timeout.
+FLUSH_BATCH_SIZE = 500
+FLUSH_INTERVAL_SECONDS = 0.1
+
+_log_queue = queue.Queue()
+_worker_started = threading.Event()
+
+
+def log_activity(user_id, action, ip_address, description='',
+                 user_agent='', success=True, metadata=None):
+    """Queue an activity log entry for background insertion.
+
+    ip_address is required: the column is NOT NULL, and a null here would
+    be dropped silently by the ignore_conflicts bulk_create instead of
+    failing loudly at the call site.
+    """
+    from .models import UserActivityLog
+
+    _log_queue.put(UserActivityLog(
+        user_id=user_id,
+        action=action,
+        description=description,
+        ip_address=ip_address,
+        user_agent=user_agent,
+        success=success,
+        metadata=metadata or {}
+    ))
+
+
+def flush(timeout=FLUSH_INTERVAL_SECONDS):
+    """Drain pending entries into one bulk_create. Returns rows written."""
+    from .models import UserActivityLog
+
+    batch = []
+    try:
+        batch.append(_log_queue.get(timeout=timeout))
+        while len(batch) < FLUSH_BATCH_SIZE:
+            batch.append(_log_queue.get_nowait())
+    except queue.Empty:
+        pass
+
+    if batch:
+        UserActivityLog.objects.bulk_create(batch, ignore_conflicts=True)
+    return len(batch)
+
+
+def _worker():
+    while True:
+        try:
+            flush()
+        except Exception:
+            # Logging must never take the worker down; drop the batch and
+            # keep draining.
+            pass
+
+
+def start_worker():
+    """Start the background flush thread once per process."""
+    if _worker_started.is_set():
+        return
+    _worker_started.set()
+    threading.Thread(
+        target=_worker,
+        name='activity-log-flusher',
+        daemon=True
+    ).start()
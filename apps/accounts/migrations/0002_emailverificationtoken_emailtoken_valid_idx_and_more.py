@@ -0,0 +1,29 @@
+# Generated by Django 5.2.4 on 2026-08-31 18:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='emailverificationtoken',
+            index=models.Index(fields=['token', 'is_used', 'expires_at'], name='emailtoken_valid_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='passwordresettoken',
+            index=models.Index(fields=['token', 'is_used', 'expires_at'], name='resettoken_valid_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='useractivitylog',
+            index=models.Index(fields=['user', '-created_at'], name='useractivity_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usersession',
+            index=models.Index(fields=['user', 'is_active', '-last_activity'], name='usersess_active_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-08-31 18:14
+
+import apps.accounts.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_emailverificationtoken_emailtoken_valid_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='phone',
+            field=models.CharField(blank=True, max_length=20, null=True, validators=[apps.accounts.models.validate_phone], verbose_name='Phone Number'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-08-31 18:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_alter_user_phone'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='date_of_birth',
+            field=models.DateField(blank=True, help_text='Required for age verification in certain movies', null=True, verbose_name='Date of Birth'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.4 on 2026-08-31 18:14
+
+import apps.accounts.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_alter_user_date_of_birth'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='emailverificationtoken',
+            name='expires_at',
+            field=models.DateTimeField(default=apps.accounts.models._email_token_expiry),
+        ),
+        migrations.AlterField(
+            model_name='passwordresettoken',
+            name='expires_at',
+            field=models.DateTimeField(default=apps.accounts.models._password_reset_expiry),
+        ),
+    ]
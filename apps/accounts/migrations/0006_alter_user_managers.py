@@ -0,0 +1,20 @@
+# Generated by Django 5.2.4 on 2026-08-31 18:15
+
+import apps.accounts.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_alter_emailverificationtoken_expires_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='user',
+            managers=[
+                ('objects', apps.accounts.models.UserManager()),
+            ],
+        ),
+    ]
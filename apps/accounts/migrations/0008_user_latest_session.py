@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-08-31 18:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_user_user_active_verified_idx_user_user_email_ci_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='latest_session',
+            field=models.ForeignKey(blank=True, help_text='Denormalized pointer to the most recent session', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='accounts.usersession'),
+        ),
+    ]
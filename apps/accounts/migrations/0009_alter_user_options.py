@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-08-31 18:18
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0008_user_latest_session'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='user',
+            options={'base_manager_name': 'objects', 'verbose_name': 'User', 'verbose_name_plural': 'Users'},
+        ),
+    ]
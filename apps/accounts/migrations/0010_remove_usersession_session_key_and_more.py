@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-08-31 18:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0009_alter_user_options'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='usersession',
+            name='session_key',
+        ),
+        migrations.AddField(
+            model_name='usersession',
+            name='session_key_hash',
+            field=models.BinaryField(default=b'', help_text='blake2s-128 digest of the framework session key', max_length=16, unique=True, verbose_name='Session Key Hash'),
+            preserve_default=False,
+        ),
+    ]
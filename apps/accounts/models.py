@@ -1,10 +1,48 @@
 from django.db import models
-from django.contrib.auth.models import AbstractUser
-from django.core.validators import RegexValidator
+from django.contrib.auth.models import AbstractUser, UserManager as DjangoUserManager
+from django.core.exceptions import ValidationError
+from django.db.models.functions import Lower
 from django.utils import timezone
+from django.utils.functional import cached_property
 from datetime import timedelta
+import hashlib
+import re
 import uuid
 
+# Compiled once at import; \Z anchors the match without $'s newline ambiguity.
+_PHONE_RE = re.compile(r'\+?1?\d{9,15}\Z')
+
+_AGE_RESTRICTIONS = {
+    'G': 0,
+    'PG': 0,
+    'PG-13': 13,
+    'R': 17,
+    'NC-17': 18
+}
+
+def validate_phone(value):
+    """Validate phone format with cheap guards before touching the regex."""
+    if not value or len(value) > 17 or value[0] not in '+0123456789' \
+            or not _PHONE_RE.match(value):
+        raise ValidationError(
+            "Phone number must be entered in format: '+123456789.  19 digits allowed"
+        )
+
+class UserManager(DjangoUserManager):
+
+    def get_queryset(self):
+        # Profile and preferences are one-to-ones read by almost every
+        # consumer; eager-load them by default so forgetting select_related
+        # never reintroduces two extra SELECTs per user.
+        return super().get_queryset().select_related('profile', 'preferences')
+
+    def get_by_natural_key(self, username):
+        # Login only needs the credentials and status flags; skip hydrating
+        # the rest of the row (and drop the default joins).
+        return self.select_related(None).only(
+            'id', 'password', 'is_active', 'is_email_verified', 'email'
+        ).get(**{self.model.USERNAME_FIELD: username})
+
 class User(AbstractUser):
 
     email = models.EmailField(
@@ -18,15 +56,10 @@ class User(AbstractUser):
         max_length=20,
         blank=True,
         null=True,
-        validators= [
-            RegexValidator(
-                regex=r'^\+?1?\d{9,15}$',
-                message="Phone number must be entered in format: '+123456789.  19 digits allowed"
-            )
-        ]
+        validators=[validate_phone]
     )
 
-    date_of_birth = models.DateTimeField(
+    date_of_birth = models.DateField(
         "Date of Birth",
         null=True,
         blank=True,
@@ -63,12 +96,31 @@ class User(AbstractUser):
         auto_now=True
     )
 
+    latest_session = models.ForeignKey(
+        'UserSession',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text="Denormalized pointer to the most recent session"
+    )
+
+    objects = UserManager()
+
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username', 'first_name', 'last_name']
 
     class Meta:
         verbose_name = "User"
         verbose_name_plural = "Users"
+        base_manager_name = 'objects'
+        indexes = [
+            models.Index(
+                fields=['is_active', 'is_email_verified'],
+                name='user_active_verified_idx'
+            ),
+            models.Index(Lower('email'), name='user_email_ci_idx')
+        ]
 
     def __str__(self):
         return f"{self.get_full_name()} - ({self.email})"
@@ -80,7 +132,7 @@ class User(AbstractUser):
     def get_short_name(self):
         return self.first_name
     
-    @property
+    @cached_property
     def age(self):
         if self.date_of_birth:
             today = timezone.now().date()
@@ -88,23 +140,16 @@ class User(AbstractUser):
                 (today.month, today.day) < (self.date_of_birth.month, self.date_of_birth.day)
             )
         return None
-    
-    @property
+
+    @cached_property
     def is_adult(self):
         return self.age and self.age >= 18
     
     def can_watch_rated_content(self, content_rating):
-        age_restrictions = {
-            'G': 0,
-            'PG': 0,
-            'PG-13': 13,
-            'R': 17,
-            'NC-17': 18
-        }
-        if content_rating not in age_restrictions:
+        required_age = _AGE_RESTRICTIONS.get(content_rating)
+        if required_age is None:
             return True
-        
-        required_age = age_restrictions[content_rating]
+
         return self.age and self.age >= required_age
     
 class UserProfile(models.Model):
@@ -238,6 +283,14 @@ class UserPreferences(models.Model):
         return f"{self.user.email} - Preferences"
 
 
+def _email_token_expiry():
+    # Token expires in 24 hours
+    return timezone.now() + timedelta(hours=24)
+
+def _password_reset_expiry():
+    # Token expires in 1 hour
+    return timezone.now() + timedelta(hours=1)
+
 class EmailVerificationToken(models.Model):
     user = models.ForeignKey(
         User,
@@ -250,22 +303,22 @@ class EmailVerificationToken(models.Model):
         editable=False
     )
     created_at = models.DateTimeField(auto_now_add=True)
-    expires_at = models.DateTimeField()
+    expires_at = models.DateTimeField(default=_email_token_expiry)
     is_used = models.BooleanField(default=False)
 
     class Meta:
         verbose_name = 'Email Verification Token'
         verbose_name_plural = 'Email Verification Tokens'
+        indexes = [
+            models.Index(
+                fields=['token', 'is_used', 'expires_at'],
+                name='emailtoken_valid_idx'
+            )
+        ]
 
     def __str__(self):
         return f"Email verification for {self.user.email}"
 
-    def save(self, *args, **kwargs):
-        if not self.expires_at:
-            # Token expires in 24 hours
-            self.expires_at = timezone.now() + timedelta(hours=24)
-        super().save(*args, **kwargs)
-
     @property
     def is_expired(self):
         """Check if token has expired"""
@@ -289,22 +342,22 @@ class PasswordResetToken(models.Model):
         editable=False
     )
     created_at = models.DateTimeField(auto_now_add=True)
-    expires_at = models.DateTimeField()
+    expires_at = models.DateTimeField(default=_password_reset_expiry)
     is_used = models.BooleanField(default=False)
 
     class Meta:
         verbose_name = 'Password Reset Token'
         verbose_name_plural = 'Password Reset Tokens'
+        indexes = [
+            models.Index(
+                fields=['token', 'is_used', 'expires_at'],
+                name='resettoken_valid_idx'
+            )
+        ]
 
     def __str__(self):
         return f"Password reset for {self.user.email}"
 
-    def save(self, *args, **kwargs):
-        if not self.expires_at:
-            # Token expires in 1 hour
-            self.expires_at = timezone.now() + timedelta(hours=1)
-        super().save(*args, **kwargs)
-
     @property
     def is_expired(self):
         """Check if token has expired"""
@@ -322,7 +375,12 @@ class UserSession(models.Model):
         on_delete=models.CASCADE,
         related_name='sessions'
     )
-    session_key = models.CharField(max_length=40, unique=True)
+    session_key_hash = models.BinaryField(
+        "Session Key Hash",
+        max_length=16,
+        unique=True,
+        help_text="blake2s-128 digest of the framework session key"
+    )
     ip_address = models.GenericIPAddressField()
     user_agent = models.TextField()
     location = models.CharField(
@@ -348,10 +406,28 @@ class UserSession(models.Model):
     class Meta:
         verbose_name = 'User Session'
         verbose_name_plural = 'User Sessions'
+        indexes = [
+            models.Index(
+                fields=['user', 'is_active', '-last_activity'],
+                name='usersess_active_idx'
+            )
+        ]
 
     def __str__(self):
         return f"{self.user.email} - {self.device_type} - {self.created_at}"
 
+    @staticmethod
+    def hash_session_key(session_key):
+        """Digest a framework session key into the stored 16-byte form."""
+        return hashlib.blake2s(session_key.encode(), digest_size=16).digest()
+
+    def save(self, *args, **kwargs):
+        is_new = self._state.adding
+        super().save(*args, **kwargs)
+        if is_new:
+            # Keep the denormalized pointer current with one targeted UPDATE.
+            User.objects.filter(pk=self.user_id).update(latest_session=self)
+
     def logout(self):
         """Mark session as logged out"""
         self.is_active = False
@@ -405,6 +481,12 @@ class UserActivityLog(models.Model):
     class Meta:
         verbose_name = 'User Activity Log'
         verbose_name_plural = 'User Activity Logs'
+        indexes = [
+            models.Index(
+                fields=['user', '-created_at'],
+                name='useractivity_recent_idx'
+            )
+        ]
 
     def __str__(self):
         return f"{self.user.email} - {self.action} - {self.created_at}"
\ No newline at end of file
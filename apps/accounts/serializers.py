@@ -1,8 +1,14 @@
+import threading
+import time
+
 from rest_framework import serializers
 from rest_framework.validators import UniqueValidator
 from django.contrib.auth import authenticate
+from django.db.models import Count
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from .models import (
     User, 
@@ -23,7 +29,6 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
     password = serializers.CharField(
         write_only=True,
         required=True,
-        validators=[validate_password],
         style={'input_type': 'password'}
     )
 
@@ -79,7 +84,14 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError({
                 'password': "The passwords do not match"
             })
-    
+
+        # Run the expensive password validators only once the cheap
+        # mismatch check has passed.
+        try:
+            validate_password(attrs['password'])
+        except ValidationError as exc:
+            raise serializers.ValidationError({'password': exc.messages})
+
         if not attrs.get('accept_terms'):
             raise serializers.ValidationError({
                 'accept_terms': 'You must accept the terms and conditions'
@@ -124,27 +136,39 @@ class UserLoginSerializer(serializers.Serializer):
         password = attrs.get('password')
 
         if email and password:
-            user = authenticate(
-                request=self.context.get('request'),
-                username=email,
-                password=password
-            )
-        
-            if not user:
+            # Check the cheap account flags before authenticate() so unknown
+            # or blocked accounts never reach the password hasher.
+            flags = User.objects.filter(email=email).values_list(
+                'is_active', 'is_email_verified'
+            ).first()
+
+            if flags is None:
                 raise serializers.ValidationError({
                     'non_fields_error': 'Invalid email or password'
                 })
-            
-            if not user.is_active:
+
+            is_active, is_email_verified = flags
+            if not is_active:
                 raise serializers.ValidationError({
                     'non_fields_error': 'Your account is disabled'
                 })
-            
-            if not user.is_email_verified:
+
+            if not is_email_verified:
                 raise serializers.ValidationError({
                     'non_fields_error': 'Please verify your email address before logging in'
                 })
-            
+
+            user = authenticate(
+                request=self.context.get('request'),
+                username=email,
+                password=password
+            )
+
+            if not user:
+                raise serializers.ValidationError({
+                    'non_fields_error': 'Invalid email or password'
+                })
+
             attrs['user'] = user
             return attrs
         
@@ -153,7 +177,7 @@ class UserLoginSerializer(serializers.Serializer):
         })
     
 class UserProfileSerializer(serializers.ModelSerializer):
-    full_name = serializers.SerializerMethodField()
+    full_name = serializers.CharField(source='get_full_name', read_only=True)
     age = serializers.ReadOnlyField()
     is_adult = serializers.ReadOnlyField()
 
@@ -171,9 +195,6 @@ class UserProfileSerializer(serializers.ModelSerializer):
             'date_joined', 'last_login'
         ]
 
-    def get_full_name(self, obj):
-        return obj.get_full_name()
-    
 class UserProfileDetailSerializer(serializers.ModelSerializer):
     class Meta:
         model = UserProfile
@@ -240,17 +261,52 @@ class PasswordChangeSerializer(serializers.Serializer):
         return user
     
 class PasswordResetRequestSerializer(serializers.Serializer):
+    # No existence check here: the reset email sender should look the account
+    # up off the request path, and not revealing whether an email is
+    # registered is the intended behavior anyway.
     email = serializers.EmailField(required=True)
-    
-    def validate_emai(self, value):
-        try:
-            user = User.objects.get(email=value, is_active=True)
 
-        except User.DoesNotExist:
-            pass # Don't reveal if email exists for security reasons
-        
-        return value
-    
+
+class _NegativeTokenCache:
+    """In-process TTL cache of recently-rejected reset tokens.
+
+    Under token-guessing spam, most confirm attempts carry invalid tokens;
+    remembering rejections for a while answers repeats without a DB lookup.
+    Tokens never become valid after rejection (is_used only ever flips on,
+    expiry only passes), so staleness is bounded by the TTL.
+    """
+
+    def __init__(self, maxsize=100_000, ttl=3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, token):
+        with self._lock:
+            expiry = self._entries.get(token)
+            if expiry is None:
+                return False
+            if expiry < time.monotonic():
+                del self._entries[token]
+                return False
+            return True
+
+    def add(self, token):
+        with self._lock:
+            if len(self._entries) >= self.maxsize:
+                now = time.monotonic()
+                self._entries = {
+                    key: expiry for key, expiry in self._entries.items()
+                    if expiry >= now
+                }
+                while len(self._entries) >= self.maxsize:
+                    self._entries.pop(next(iter(self._entries)))
+            self._entries[token] = time.monotonic() + self.ttl
+
+
+_invalid_reset_tokens = _NegativeTokenCache()
+
 class PasswordResetConfirmSerializer(serializers.Serializer):
     token = serializers.UUIDField(required=True)
     new_password = serializers.CharField(
@@ -266,13 +322,20 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
     )
 
     def validate_token(self, value):
-        try:
-            reset_token = PasswordResetToken.objects.get(token=value)
-            if not reset_token.is_valid:
-                raise serializers.ValidationError("Invalid or expired token.")
-        except PasswordResetToken.DoesNotExist:
-            raise serializers.ValidationError("Invalid token.")
-        
+        if value in _invalid_reset_tokens:
+            raise serializers.ValidationError("Invalid or expired token.")
+
+        # Filter validity in SQL so expired/used tokens never materialize,
+        # and only hydrate the columns save() needs.
+        reset_token = PasswordResetToken.objects.filter(
+            token=value,
+            is_used=False,
+            expires_at__gt=timezone.now()
+        ).only('id', 'user').first()
+        if reset_token is None:
+            _invalid_reset_tokens.add(value)
+            raise serializers.ValidationError("Invalid or expired token.")
+
         self.reset_token = reset_token
         return value
 
@@ -286,12 +349,13 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
     def save(self):
         user = self.reset_token.user
         user.set_password(self.validated_data['new_password'])
-        user.save()
-        
-        # Mark token as used
-        self.reset_token.is_used = True
-        self.reset_token.save()
-        
+
+        with transaction.atomic():
+            user.save(update_fields=['password', 'updated_at'])
+            # Mark token as used; .update() writes the single column without
+            # re-running model save machinery.
+            PasswordResetToken.objects.filter(pk=self.reset_token.pk).update(is_used=True)
+
         return user
 
 
@@ -299,25 +363,28 @@ class EmailVerificationSerializer(serializers.Serializer):
     token = serializers.UUIDField(required=True)
 
     def validate_token(self, value):
-        try:
-            verification_token = EmailVerificationToken.objects.get(token=value)
-            if not verification_token.is_valid:
-                raise serializers.ValidationError("Invalid or expired token.")
-        except EmailVerificationToken.DoesNotExist:
-            raise serializers.ValidationError("Invalid token.")
-        
+        verification_token = EmailVerificationToken.objects.filter(
+            token=value,
+            is_used=False,
+            expires_at__gt=timezone.now()
+        ).only('id', 'user').first()
+        if verification_token is None:
+            raise serializers.ValidationError("Invalid or expired token.")
+
         self.verification_token = verification_token
         return value
 
     def save(self):
         user = self.verification_token.user
         user.is_email_verified = True
-        user.save()
-        
-        # Mark token as used
-        self.verification_token.is_used = True
-        self.verification_token.save()
-        
+
+        with transaction.atomic():
+            user.save(update_fields=['is_email_verified', 'updated_at'])
+            # Mark token as used
+            EmailVerificationToken.objects.filter(
+                pk=self.verification_token.pk
+            ).update(is_used=True)
+
         return user
 
 
@@ -339,10 +406,19 @@ class UserSessionSerializer(serializers.ModelSerializer):
         return int(duration.total_seconds() / 60) if duration else None
 
     def get_is_current(self, obj):
-        request = self.context.get('request')
-        if request and hasattr(request, 'session'):
-            return obj.session_key == request.session.session_key
-        return False
+        # Resolve and hash the request's session key once per serialization
+        # instead of touching request.session for every row.
+        current_key_hash = self.context.get('current_session_key_hash')
+        if current_key_hash is None:
+            request = self.context.get('request')
+            if not (request and hasattr(request, 'session')):
+                return False
+            current_key = request.session.session_key
+            if current_key is None:
+                return False
+            current_key_hash = UserSession.hash_session_key(current_key)
+            self.context['current_session_key_hash'] = current_key_hash
+        return bytes(obj.session_key_hash) == current_key_hash
 
 
 class UserActivityLogSerializer(serializers.ModelSerializer):
@@ -358,11 +434,21 @@ class UserActivityLogSerializer(serializers.ModelSerializer):
 class UserAccountSummarySerializer(serializers.ModelSerializer):
     profile = UserProfileDetailSerializer(read_only=True)
     preferences = UserPreferencesSerializer(read_only=True)
-    total_bookings = serializers.SerializerMethodField()
-    total_sessions = serializers.SerializerMethodField()
+    total_bookings = serializers.IntegerField(read_only=True)
+    total_sessions = serializers.IntegerField(read_only=True)
     last_activity = serializers.SerializerMethodField()
     account_age_days = serializers.SerializerMethodField()
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Eager-load every relation this serializer touches in one pass."""
+        return queryset.select_related(
+            'profile', 'preferences', 'latest_session'
+        ).annotate(
+            total_bookings=Count('bookings', distinct=True),
+            total_sessions=Count('sessions', distinct=True)
+        )
+
     class Meta:
         model = User
         fields = [
@@ -378,15 +464,13 @@ class UserAccountSummarySerializer(serializers.ModelSerializer):
             'date_joined', 'last_login'
         ]
 
-    def get_total_bookings(self, obj):
-        return getattr(obj, 'bookings', obj.bookings).count()
-
-    def get_total_sessions(self, obj):
-        return obj.sessions.count()
-
     def get_last_activity(self, obj):
-        last_session = obj.sessions.filter(is_active=True).first()
-        return last_session.last_activity if last_session else obj.last_login
+        # Denormalized on User and kept current by UserSession.save; no
+        # session query needed per serialized user.
+        latest_session = obj.latest_session
+        if latest_session is not None and latest_session.is_active:
+            return latest_session.last_activity
+        return obj.last_login
 
     def get_account_age_days(self, obj):
         from django.utils import timezone
@@ -404,19 +488,23 @@ class UserUpdateSerializer(serializers.ModelSerializer):
             'preferred_language'
         ]
 
-    def validate_phone(self, value):
-        if value:
-            # Reset phone verification if phone changes
-            if self.instance and self.instance.phone != value:
-                self.instance.is_phone_verified = False
-        return value
-
     def update(self, instance, validated_data):
-        phone = validated_data.get('phone')
-        if phone and instance.phone != phone:
+        # Reset phone verification if phone changes
+        phone_changed = (
+            'phone' in validated_data
+            and validated_data['phone'] != instance.phone
+        )
+
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+
+        update_fields = list(validated_data) + ['updated_at']
+        if phone_changed:
             instance.is_phone_verified = False
-        
-        return super().update(instance, validated_data)
+            update_fields.append('is_phone_verified')
+
+        instance.save(update_fields=update_fields)
+        return instance
 
 
 class UserDeactivationSerializer(serializers.Serializer):
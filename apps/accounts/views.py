@@ -1,4 +1,12 @@
-from rest_framework import viewsets, permissions
+from django.utils import timezone
+from rest_framework import viewsets, permissions, status
+from rest_framework.decorators import action
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.bookings.models import Booking, BookedSeat, SeatReservation
 from .models import (
     User,
     UserProfile
@@ -7,21 +15,10 @@ from .serializers import (
     UserProfileSerializer,
     UserUpdateSerializer,
     UserAccountSummarySerializer,
-    UserProfileDetailSerializer
+    UserProfileDetailSerializer,
+    UserRegistrationSerializer,
+    UserLoginSerializer
 )
-from rest_framework.decorators import action
-from rest_framework.response import Response
-
-from apps.bookings.models import Booking, SeatReservation
-from apps.bookings.serializers import BookingSerializer, SeatReservationSerializer
-from django.utils import timezone
-
-from rest_framework.permissions import AllowAny
-from rest_framework.views import APIView
-from rest_framework.response import Response
-from rest_framework import status
-from .serializers import UserRegistrationSerializer, UserLoginSerializer
-from rest_framework_simplejwt.tokens import RefreshToken
 
 class UserRegistrationView(APIView):
     def post(self, request, *args, **kwargs):
@@ -49,23 +46,40 @@ class UserLoginView(APIView):
 class UserViewSet(viewsets.ModelViewSet):
     queryset = User.objects.all()
     permission_classes = [permissions.IsAuthenticated]
+    serializer_class_map = {
+        'update': UserUpdateSerializer,
+        'partial_update': UserUpdateSerializer,
+        'account_summary': UserAccountSummarySerializer,
+    }
 
     def get_serializer_class(self):
-        if self.action == 'update' or self.action == 'partial_update':
-            return UserUpdateSerializer
-        elif self.action == 'account_summary':
-            return UserAccountSummarySerializer
-        return UserProfileSerializer
+        return self.serializer_class_map.get(self.action, UserProfileSerializer)
     
     def get_queryset(self):
         user = self.request.user
         if user.is_staff:
-            return User.objects.all()
-        return User.objects.filter(pk=user.pk)
+            queryset = User.objects.all()
+        else:
+            queryset = User.objects.filter(pk=user.pk)
+
+        if self.action in ('list', 'retrieve'):
+            # UserProfileSerializer reads a fixed field set; skip hydrating
+            # the rest of the row (password hash, staff flags, ...). The
+            # manager's default select_related must be dropped first —
+            # only() cannot defer a relation the query also traverses.
+            queryset = queryset.select_related(None).only(
+                'id', 'email', 'first_name', 'last_name', 'phone',
+                'date_of_birth', 'preferred_language', 'is_email_verified',
+                'is_phone_verified', 'date_joined', 'last_login'
+            )
+        return queryset
     
     @action(detail=False, methods=['get'], url_path='account_summary')
     def account_summary(self, request):
-        serializer = self.get_serializer(request.user)
+        queryset = UserAccountSummarySerializer.setup_eager_loading(
+            User.objects.filter(pk=request.user.pk)
+        )
+        serializer = self.get_serializer(queryset.get())
         return Response(serializer.data)
 
     def retrieve(self, request, *args, **kwargs):
@@ -87,18 +101,63 @@ class UserViewSet(viewsets.ModelViewSet):
 
     @action(detail=True, methods=['get'], url_path='booking-history')
     def booking_history(self, request, pk=None):
+        # Read-only flat data: build plain dicts from two values() queries
+        # and skip the DRF field machinery entirely.
         user = self.get_object()
-        bookings = Booking.objects.filter(user=user).select_related('movie_schedule', 'movie_schedule__movie')
-        serializer = BookingSerializer(bookings, many=True)
-        return Response(serializer.data)
+        bookings = Booking.objects.filter(user=user).values(
+            'id', 'booking_status', 'booking_time', 'expires_at',
+            'confirmed_at', 'total_amount',
+            'movie_schedule__movie__title', 'movie_schedule__start_time'
+        )
+
+        seats_by_booking = {}
+        booked_seats = BookedSeat.objects.filter(booking__user=user).values(
+            'booking_id', 'seat__row', 'seat__seat_number'
+        )
+        for seat in booked_seats:
+            seats_by_booking.setdefault(seat['booking_id'], []).append({
+                'row': seat['seat__row'],
+                'seat_number': seat['seat__seat_number']
+            })
+
+        return Response([
+            {
+                'id': booking['id'],
+                'movie_title': booking['movie_schedule__movie__title'],
+                'start_time': booking['movie_schedule__start_time'],
+                'booking_status': booking['booking_status'],
+                'booking_time': booking['booking_time'],
+                'expires_at': booking['expires_at'],
+                'confirmed_at': booking['confirmed_at'],
+                'total_amount': booking['total_amount'],
+                'booked_seats': seats_by_booking.get(booking['id'], [])
+            }
+            for booking in bookings
+        ])
 
     @action(detail=True, methods=['get'], url_path='active-seat-reservations')
     def active_seat_reservations(self, request, pk=None):
         user = self.get_object()
         now = timezone.now()
-        reservations = SeatReservation.objects.filter(user=user, reserved_until__gte=now)
-        serializer = SeatReservationSerializer(reservations, many=True)
-        return Response(serializer.data)
+        reservations = SeatReservation.objects.filter(
+            user=user, reserved_until__gte=now
+        ).values(
+            'id', 'seat__row', 'seat__seat_number',
+            'movie_schedule__movie__title', 'movie_schedule__start_time',
+            'reserved_at', 'reserved_until'
+        )
+        return Response([
+            {
+                'id': reservation['id'],
+                'row': reservation['seat__row'],
+                'seat_number': reservation['seat__seat_number'],
+                'movie_title': reservation['movie_schedule__movie__title'],
+                'start_time': reservation['movie_schedule__start_time'],
+                'reserved_at': reservation['reserved_at'],
+                'reserved_until': reservation['reserved_until']
+            }
+            for reservation in reservations
+        ])
     
 class UserProfileViewSet(viewsets.ModelViewSet):
     queryset = UserProfile.objects.all()
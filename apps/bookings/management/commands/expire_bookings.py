@@ -0,0 +1,61 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from apps.bookings.models import (
+    Booking,
+    BookingHistory,
+    SeatReservation,
+    _credit_booked_seats
+)
+
+
+class Command(BaseCommand):
+    help = "Expire overdue pending bookings and drop stale seat reservations"
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+
+        with transaction.atomic():
+            # Grab the ids first so the audit rows match exactly the rows
+            # the UPDATE touches, then close everything in one statement —
+            # no per-booking save() loop. Both the filter and the UPDATE
+            # ride the (booking_status, expires_at) index.
+            expired_ids = list(
+                Booking.objects.filter(
+                    booking_status='PENDING',
+                    expires_at__lt=now
+                ).values_list('id', flat=True)
+            )
+
+            expired = 0
+            if expired_ids:
+                expired = Booking.objects.filter(
+                    pk__in=expired_ids,
+                    booking_status='PENDING'
+                ).update(booking_status='EXPIRED')
+
+                BookingHistory.objects.bulk_create([
+                    BookingHistory(
+                        booking_id=booking_id,
+                        action='expired',
+                        description='Expired by sweeper',
+                        metadata={'expired_at': now.isoformat()}
+                    )
+                    for booking_id in expired_ids
+                ])
+
+                # The BookedSeat rows stay for the audit trail, so no
+                # delete signal credits the schedules — do it here.
+                _credit_booked_seats(expired_ids)
+
+        # Reservation rows past reserved_until are dead weight under the
+        # (movie_schedule, seat) unique constraint; one DELETE frees the
+        # seats for rebooking.
+        released, _ = SeatReservation.objects.filter(
+            reserved_until__lt=now
+        ).delete()
+
+        self.stdout.write(
+            f"Expired {expired} bookings, released {released} stale reservations"
+        )
@@ -0,0 +1,152 @@
+# Generated by Django 5.2.4 on 2026-08-31 18:21
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0001_initial'),
+        ('movies', '0002_cinema_seattype_alter_movie_options_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookingHistory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('action', models.CharField(choices=[('created', 'Created'), ('confirmed', 'Confirmed'), ('cancelled', 'Cancelled'), ('expired', 'Expired'), ('refunded', 'Refunded')], max_length=20, verbose_name='Action')),
+                ('description', models.TextField(blank=True, verbose_name='Description')),
+                ('timestamp', models.DateTimeField(auto_now_add=True)),
+                ('metadata', models.JSONField(blank=True, default=dict, verbose_name='Metadata')),
+            ],
+            options={
+                'ordering': ['-timestamp'],
+            },
+        ),
+        migrations.AlterModelOptions(
+            name='booking',
+            options={'ordering': ['-booking_time']},
+        ),
+        migrations.RemoveField(
+            model_name='booking',
+            name='booking_reference',
+        ),
+        migrations.RemoveField(
+            model_name='seatreservation',
+            name='row',
+        ),
+        migrations.RemoveField(
+            model_name='seatreservation',
+            name='seat_number',
+        ),
+        migrations.AddField(
+            model_name='bookedseat',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='bookedseat',
+            name='price_paid',
+            field=models.DecimalField(decimal_places=2, default=0, help_text='Actual price paid for this seat', max_digits=8, verbose_name='Price Paid'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='bookedseat',
+            name='seat',
+            field=models.ForeignKey(default=0, on_delete=django.db.models.deletion.CASCADE, related_name='bookings', to='movies.seat'),
+            preserve_default=False,
+        ),
+        migrations.AlterUniqueTogether(
+            name='bookedseat',
+            unique_together={('booking', 'seat')},
+        ),
+        migrations.AddField(
+            model_name='booking',
+            name='notes',
+            field=models.TextField(blank=True, help_text='Internal notes about the booking', verbose_name='Notes'),
+        ),
+        migrations.AddField(
+            model_name='booking',
+            name='payment_method',
+            field=models.CharField(blank=True, max_length=50, null=True, verbose_name='Payment Method'),
+        ),
+        migrations.AddField(
+            model_name='booking',
+            name='payment_reference',
+            field=models.CharField(blank=True, max_length=100, null=True, verbose_name='Payment Reference'),
+        ),
+        migrations.AddField(
+            model_name='seatreservation',
+            name='seat',
+            field=models.ForeignKey(default=0, on_delete=django.db.models.deletion.CASCADE, related_name='reservations', to='movies.seat'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='seatreservation',
+            name='session_key',
+            field=models.CharField(blank=True, max_length=40, null=True, verbose_name='Session Key'),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='booking_status',
+            field=models.CharField(choices=[('PENDING', 'Pending'), ('CONFIRMED', 'Confirmed'), ('CANCELLED', 'Cancelled'), ('EXPIRED', 'Expired')], default='PENDING', max_length=10, verbose_name='Booking Status'),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='booking_time',
+            field=models.DateTimeField(auto_now_add=True, verbose_name='Booking Time'),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='confirmed_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Confirmed At'),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='expires_at',
+            field=models.DateTimeField(verbose_name='Expires At'),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='total_amount',
+            field=models.DecimalField(decimal_places=2, max_digits=8, verbose_name='Total Amount'),
+        ),
+        migrations.AlterField(
+            model_name='seatreservation',
+            name='reserved_at',
+            field=models.DateTimeField(auto_now_add=True, verbose_name='Reserved At'),
+        ),
+        migrations.AlterField(
+            model_name='seatreservation',
+            name='reserved_until',
+            field=models.DateTimeField(verbose_name='Reserved Until'),
+        ),
+        migrations.AddConstraint(
+            model_name='seatreservation',
+            constraint=models.UniqueConstraint(fields=('movie_schedule', 'seat'), name='uniq_active_reservation'),
+        ),
+        migrations.AddField(
+            model_name='bookinghistory',
+            name='booking',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='history', to='bookings.booking'),
+        ),
+        migrations.AddField(
+            model_name='bookinghistory',
+            name='performed_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='booking_actions', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RemoveField(
+            model_name='bookedseat',
+            name='row',
+        ),
+        migrations.RemoveField(
+            model_name='bookedseat',
+            name='seat_number',
+        ),
+    ]
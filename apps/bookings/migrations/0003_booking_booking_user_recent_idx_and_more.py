@@ -0,0 +1,32 @@
+# Generated by Django 5.2.4 on 2026-08-31 18:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0002_bookinghistory_alter_booking_options_and_more'),
+        ('movies', '0002_cinema_seattype_alter_movie_options_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['user', '-booking_time'], name='booking_user_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['booking_status', 'expires_at'], name='booking_status_expiry_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='seatreservation',
+            index=models.Index(fields=['user', 'reserved_until'], name='reservation_user_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='seatreservation',
+            index=models.Index(fields=['reserved_until'], name='reservation_expiry_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-08-31 18:26
+
+import apps.bookings.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0003_booking_booking_user_recent_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booking',
+            name='booking_reference',
+            field=models.CharField(default=apps.bookings.models._booking_reference, editable=False, max_length=26, unique=True, verbose_name='Booking Reference'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-08-31 18:27
+
+import apps.bookings.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0004_booking_booking_reference'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='bookinghistory',
+            name='metadata',
+            field=apps.bookings.models.OrjsonJSONField(blank=True, default=dict, verbose_name='Metadata'),
+        ),
+    ]
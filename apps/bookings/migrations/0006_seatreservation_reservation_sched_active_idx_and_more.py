@@ -0,0 +1,24 @@
+# Generated by Django 5.2.4 on 2026-08-31 18:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0005_alter_bookinghistory_metadata'),
+        ('movies', '0003_movieschedule_schedule_screen_start_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='seatreservation',
+            index=models.Index(fields=['movie_schedule', 'reserved_until'], name='reservation_sched_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='seatreservation',
+            index=models.Index(fields=['seat', 'movie_schedule'], name='reservation_seat_sched_idx'),
+        ),
+    ]
@@ -1,10 +1,36 @@
 from django.db import models
 from django.conf import settings
 from datetime import timedelta
+from decimal import Decimal
 from django.utils import timezone
+import base64
+import orjson
 import uuid
-import string
-import random
+
+class OrjsonJSONField(models.JSONField):
+    """JSONField that encodes and decodes through orjson.
+
+    Audit metadata is written far more often than it is read; orjson avoids
+    the stdlib json hot path on both sides.
+    """
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if value is None or hasattr(value, 'as_sql'):
+            return super().get_db_prep_value(value, connection, prepared)
+        return orjson.dumps(value).decode()
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        try:
+            return orjson.loads(value)
+        except (TypeError, ValueError):
+            return value
+
+def _booking_reference():
+    # 26-char base32 of a random UUID — unique by construction, so no
+    # generate-then-SELECT retry loop is ever needed.
+    return base64.b32encode(uuid.uuid4().bytes).decode('ascii').rstrip('=')
 
 class Booking(models.Model):
     BOOKING_STATUS_CHOICES = [
@@ -26,9 +52,17 @@ class Booking(models.Model):
         related_name='bookings'
     )
 
+    booking_reference = models.CharField(
+        "Booking Reference",
+        max_length=26,
+        unique=True,
+        default=_booking_reference,
+        editable=False
+    )
+
     total_amount = models.DecimalField(
         "Total Amount",
-        max_digits=8, 
+        max_digits=8,
         decimal_places=2
     )
     
@@ -80,31 +114,51 @@ class Booking(models.Model):
 
     class Meta:
         ordering = ['-booking_time']
+        indexes = [
+            models.Index(
+                fields=['user', '-booking_time'],
+                name='booking_user_recent_idx'
+            ),
+            models.Index(
+                fields=['booking_status', 'expires_at'],
+                name='booking_status_expiry_idx'
+            )
+        ]
 
     def __str__(self):
         return f"Booking {self.booking_reference} by {self.user.email}"
 
-    def is_expired(self):
-        return timezone.now() > self.expires_at and self.booking_status == 'PENDING'
+    def is_expired(self, now=None):
+        # Batch callers pass one timezone.now() for the whole sweep.
+        if now is None:
+            now = timezone.now()
+        return now > self.expires_at and self.booking_status == 'PENDING'
 
     def total_seats(self):
+        # Use the prefetch cache when the list view has already loaded the
+        # seats; only fall back to COUNT(*) on cold instances.
+        cache = getattr(self, '_prefetched_objects_cache', None)
+        if cache is not None and 'booked_seats' in cache:
+            return len(self.booked_seats.all())
         return self.booked_seats.count()
 
     def seat_numbers(self):
         return [f"{seat.seat.row}{seat.seat.seat_number}" for seat in self.booked_seats.all()]
 
-    def can_be_cancelled(self):
+    def can_be_cancelled(self, now=None):
         if self.booking_status != 'CONFIRMED':
             return False
-        
+
         # Can't cancel if movie has already started
-        return self.movie_schedule.start_time > timezone.now()
+        if now is None:
+            now = timezone.now()
+        return self.movie_schedule.start_time > now
 
     def calculate_total_amount(self):
-        total = 0
-        for booked_seat in self.booked_seats.all():
-            total += booked_seat.seat.get_price_for_schedule(self.movie_schedule)
-        return total
+        # price_paid is denormalized onto BookedSeat at creation, so one SQL
+        # aggregate replaces the per-seat price lookups.
+        total = self.booked_seats.aggregate(total=models.Sum('price_paid'))['total']
+        return total if total is not None else Decimal('0')
 
     def confirm_booking(self, payment_method=None, payment_reference=None):
         self.booking_status = 'CONFIRMED'
@@ -116,10 +170,48 @@ class Booking(models.Model):
         self.save()
 
     def cancel_booking(self, reason=None):
+        releasing = self.booking_status in ('PENDING', 'CONFIRMED')
         self.booking_status = 'CANCELLED'
         if reason:
             self.notes = f"Cancelled: {reason}"
         self.save()
+        if releasing:
+            _credit_booked_seats([self.pk])
+
+    @classmethod
+    def bulk_confirm(cls, booking_ids, payment_method=None, payment_reference=None):
+        """Confirm many bookings with a single UPDATE."""
+        fields = {
+            'booking_status': 'CONFIRMED',
+            'confirmed_at': timezone.now()
+        }
+        if payment_method:
+            fields['payment_method'] = payment_method
+        if payment_reference:
+            fields['payment_reference'] = payment_reference
+        return cls.objects.filter(
+            pk__in=booking_ids, booking_status='PENDING'
+        ).update(**fields)
+
+    @classmethod
+    def bulk_cancel(cls, booking_ids, reason=None):
+        """Cancel many bookings with a single UPDATE."""
+        fields = {'booking_status': 'CANCELLED'}
+        if reason:
+            fields['notes'] = f"Cancelled: {reason}"
+        # Only live bookings hold seats; cancelling an already cancelled
+        # or expired one must not credit the counter cache twice.
+        cancellable = list(
+            cls.objects.filter(
+                pk__in=booking_ids,
+                booking_status__in=['PENDING', 'CONFIRMED']
+            ).values_list('id', flat=True)
+        )
+        if not cancellable:
+            return 0
+        updated = cls.objects.filter(pk__in=cancellable).update(**fields)
+        _credit_booked_seats(cancellable)
+        return updated
 
 
 class BookedSeat(models.Model):
@@ -157,6 +249,26 @@ class BookedSeat(models.Model):
         super().save(*args, **kwargs)
 
 
+def _credit_booked_seats(booking_ids):
+    """Return the bookings' seats to their schedules' counter caches.
+
+    Status transitions to CANCELLED/EXPIRED leave the BookedSeat rows in
+    place, so the post_delete signal never fires for them; callers credit
+    the counter explicitly when a live booking stops holding its seats.
+    """
+    from apps.movies.models import MovieSchedule
+
+    per_schedule = BookedSeat.objects.filter(
+        booking_id__in=booking_ids
+    ).values('booking__movie_schedule').annotate(n=models.Count('id'))
+    for row in per_schedule:
+        MovieSchedule.objects.filter(
+            pk=row['booking__movie_schedule']
+        ).update(
+            available_seats_cached=models.F('available_seats_cached') + row['n']
+        )
+
+
 class SeatReservation(models.Model):
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL, 
@@ -197,14 +309,41 @@ class SeatReservation(models.Model):
         super().save(*args, **kwargs)
 
     class Meta:
-        unique_together = ['movie_schedule', 'seat']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['movie_schedule', 'seat'],
+                name='uniq_active_reservation'
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=['user', 'reserved_until'],
+                name='reservation_user_active_idx'
+            ),
+            models.Index(
+                fields=['reserved_until'],
+                name='reservation_expiry_idx'
+            ),
+            # Availability predicates: all live holds for a schedule, and
+            # the per-seat EXISTS probe.
+            models.Index(
+                fields=['movie_schedule', 'reserved_until'],
+                name='reservation_sched_active_idx'
+            ),
+            models.Index(
+                fields=['seat', 'movie_schedule'],
+                name='reservation_seat_sched_idx'
+            )
+        ]
 
     def __str__(self):
         return f"Reserved seat {self.seat.row}{self.seat.seat_number} by {self.user.email}"
 
-    def is_expired(self):
+    def is_expired(self, now=None):
         """Check if reservation has expired"""
-        return timezone.now() > self.reserved_until
+        if now is None:
+            now = timezone.now()
+        return now > self.reserved_until
 
     def extend_reservation(self, minutes=15):
         """Extend reservation by specified minutes"""
@@ -249,7 +388,7 @@ class BookingHistory(models.Model):
 
     timestamp = models.DateTimeField(auto_now_add=True)
 
-    metadata = models.JSONField(
+    metadata = OrjsonJSONField(
         "Metadata",
         default=dict,
         blank=True
@@ -1,31 +1,43 @@
 
 
+import copy
+
+from django.db.models import F
 from django.utils import timezone
 from rest_framework import serializers
 from .models import Booking, BookedSeat, SeatReservation
+from apps.movies.models import MovieSchedule, Seat
 
 
+_fields_cache = {}
 
-class BookedSeatSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = BookedSeat
-        fields = ['id', 'seat_number', 'row']
+class CachedFieldsMixin:
+    """Build each serializer class's field set once and hand out copies.
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    DRF re-runs Meta introspection and build_field on every serializer
+    instantiation, which dominates hot list endpoints. Cache the constructed
+    fields per class; copies are handed out because binding mutates them.
+    """
 
-    def validate_seat_number(self, value):
-        if not value:
-            raise serializers.ValidationError("Seat number is required.")
-        return value
+    def get_fields(self):
+        fields = _fields_cache.get(self.__class__)
+        if fields is None:
+            fields = _fields_cache[self.__class__] = super().get_fields()
+        return copy.deepcopy(fields)
 
-    def validate_row(self, value):
-        if not value:
-            raise serializers.ValidationError("Row is required.")
-        return value
+
+class BookedSeatSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    # row/seat_number live on the related Seat; sourcing them through the
+    # relation lets a select_related('seat') prefetch serve every row.
+    seat_number = serializers.CharField(source='seat.seat_number', read_only=True)
+    row = serializers.CharField(source='seat.row', read_only=True)
+
+    class Meta:
+        model = BookedSeat
+        fields = ['id', 'seat', 'seat_number', 'row']
 
 
-class BookingSerializer(serializers.ModelSerializer):
+class BookingSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     booked_seats = BookedSeatSerializer(many=True)
 
     class Meta:
@@ -46,40 +58,104 @@ class BookingSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         booked_seats_data = validated_data.pop('booked_seats', [])
         booking = Booking.objects.create(**validated_data)
-        for seat_data in booked_seats_data:
-            BookedSeat.objects.create(booking=booking, **seat_data)
+        if booked_seats_data:
+            # Re-fetch the seats with their types in one query so pricing
+            # never walks the seat_type FK per seat, then insert every
+            # BookedSeat in a single bulk_create.
+            seat_ids = [seat_data['seat'].pk for seat_data in booked_seats_data]
+            seats = Seat.objects.filter(pk__in=seat_ids).select_related('seat_type')
+            created = BookedSeat.objects.bulk_create([
+                BookedSeat(
+                    booking=booking,
+                    seat=seat,
+                    price_paid=seat.get_price_for_schedule(booking.movie_schedule)
+                )
+                for seat in seats
+            ])
+            # bulk_create skips post_save, so keep the schedule's seat
+            # counter cache in step here. The __gte filter mirrors the
+            # signal handlers: never let the counter underflow its CHECK
+            # constraint.
+            MovieSchedule.objects.filter(
+                pk=booking.movie_schedule_id,
+                available_seats_cached__gte=len(created)
+            ).update(
+                available_seats_cached=F('available_seats_cached') - len(created)
+            )
         return booking
 
-    def to_representation(self, instance):
-        rep = super().to_representation(instance)
-        rep['user'] = instance.user.email
-        rep['movie_schedule'] = str(instance.movie_schedule)
-        return rep
+    @staticmethod
+    def _iso(value):
+        # DRF's default datetime format: isoformat with the UTC offset
+        # collapsed to 'Z'.
+        if value is None:
+            return None
+        value = value.isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
 
+    def to_representation(self, instance):
+        # Hand-rolled single pass: DRF's generic to_representation walks
+        # every field object per row and we then mutated the dict anyway.
+        # Building the dict directly skips the field iteration entirely on
+        # the read path; writes still go through the declared fields.
+        user_email = getattr(instance, 'user_email', None)
+        if user_email is not None:
+            # Queryset annotations from BookingViewSet — no FK descriptor
+            # walking per row.
+            user = user_email
+            movie_schedule = (
+                f"{instance.movie_title} - {instance.cinema_name} - "
+                f"Screen {instance.screen_number} @ "
+                f"{instance.schedule_start.strftime('%Y-%m-%d %H:%M')}"
+            )
+        else:
+            user = instance.user.email
+            movie_schedule = str(instance.movie_schedule)
+        return {
+            'id': instance.id,
+            'user': user,
+            'movie_schedule': movie_schedule,
+            'booking_reference': instance.booking_reference,
+            'total_amount': str(instance.total_amount),
+            'booking_status': instance.booking_status,
+            'booking_time': self._iso(instance.booking_time),
+            'expires_at': self._iso(instance.expires_at),
+            'confirmed_at': self._iso(instance.confirmed_at),
+            'booked_seats': [
+                {
+                    'id': booked_seat.id,
+                    'seat': booked_seat.seat_id,
+                    'seat_number': booked_seat.seat.seat_number,
+                    'row': booked_seat.seat.row
+                }
+                for booked_seat in instance.booked_seats.all()
+            ],
+        }
+
+
+class SeatReservationSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    seat_number = serializers.CharField(source='seat.seat_number', read_only=True)
+    row = serializers.CharField(source='seat.row', read_only=True)
 
-class SeatReservationSerializer(serializers.ModelSerializer):
     class Meta:
         model = SeatReservation
         fields = [
             'id',
             'user',
             'movie_schedule',
+            'seat',
             'seat_number',
             'row',
             'reserved_at',
             'reserved_until',
         ]
-
-    def validate(self, attrs):
-        existing = SeatReservation.objects.filter(
-            movie_schedule=attrs['movie_schedule'],
-            seat_number=attrs['seat_number'],
-            row=attrs['row'],
-            reserved_until__gte=timezone.now()
-        ).exists()
-        if existing:
-            raise serializers.ValidationError("Seat is already reserved.")
-        return attrs
+        # DRF would auto-generate a UniqueTogetherValidator from the
+        # uniq_active_reservation constraint, reintroducing the pre-insert
+        # SELECT this serializer exists to avoid; the DB constraint is the
+        # authoritative check (surfaced as 409 by the viewset).
+        validators = []
 
     def to_representation(self, instance):
         rep = super().to_representation(instance)
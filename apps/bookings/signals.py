@@ -0,0 +1,41 @@
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.movies.models import MovieSchedule
+from .models import BookedSeat, SeatReservation
+
+
+def _adjust_available_seats(schedule_id, delta):
+    # F() expression so concurrent holds don't clobber each other.
+    queryset = MovieSchedule.objects.filter(pk=schedule_id)
+    if delta < 0:
+        # A stale or unseeded cache must never turn the decrement into a
+        # PositiveIntegerField IntegrityError on the hold itself; skipping
+        # the update at zero just leaves the cache pessimistic.
+        queryset = queryset.filter(available_seats_cached__gte=-delta)
+    queryset.update(
+        available_seats_cached=F('available_seats_cached') + delta
+    )
+
+
+@receiver(post_save, sender=BookedSeat)
+def booked_seat_created(sender, instance, created, **kwargs):
+    if created:
+        _adjust_available_seats(instance.booking.movie_schedule_id, -1)
+
+
+@receiver(post_delete, sender=BookedSeat)
+def booked_seat_deleted(sender, instance, **kwargs):
+    _adjust_available_seats(instance.booking.movie_schedule_id, +1)
+
+
+@receiver(post_save, sender=SeatReservation)
+def reservation_created(sender, instance, created, **kwargs):
+    if created:
+        _adjust_available_seats(instance.movie_schedule_id, -1)
+
+
+@receiver(post_delete, sender=SeatReservation)
+def reservation_deleted(sender, instance, **kwargs):
+    _adjust_available_seats(instance.movie_schedule_id, +1)
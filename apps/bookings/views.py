@@ -1,4 +1,6 @@
 
+from django.db import IntegrityError
+from django.db.models import F, Prefetch
 from rest_framework import viewsets, permissions, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
@@ -15,13 +17,34 @@ class BookingViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
 
     def get_queryset(self):
-        return Booking.objects.filter(user=self.request.user)
+        # Annotate the handful of related columns the serializer flattens
+        # into strings, instead of joining whole related rows just so
+        # to_representation can walk the descriptor chain per booking.
+        return Booking.objects.filter(user=self.request.user).annotate(
+            user_email=F('user__email'),
+            movie_title=F('movie_schedule__movie__title'),
+            cinema_name=F('movie_schedule__screen__cinema__name'),
+            screen_number=F('movie_schedule__screen__screen_number'),
+            schedule_start=F('movie_schedule__start_time')
+        ).only(
+            # notes/payment_method/payment_reference never reach the
+            # serializer; skip wiring them over per row.
+            'id', 'user', 'movie_schedule', 'booking_reference',
+            'total_amount', 'booking_status', 'booking_time',
+            'expires_at', 'confirmed_at'
+        ).prefetch_related(
+            Prefetch(
+                'booked_seats',
+                queryset=BookedSeat.objects.select_related('seat')
+            )
+        )
 
     @action(detail=True, methods=["post"], url_path="cancel")
     def cancel_booking(self, request, pk=None):
         booking = self.get_object()
-        booking.booking_status = "CANCELLED"
-        booking.save()
+        # The model method also credits the seats back to the schedule's
+        # counter cache.
+        booking.cancel_booking()
         return Response({"status": "Booking cancelled"}, status=status.HTTP_200_OK)
 
 
@@ -39,8 +62,22 @@ class SeatReservationViewSet(viewsets.ModelViewSet):
     serializer_class = SeatReservationSerializer
     permission_classes = [permissions.IsAuthenticated]
 
+    def create(self, request, *args, **kwargs):
+        # The (movie_schedule, seat) unique constraint is the authoritative
+        # duplicate check — a validator SELECT would just race with
+        # concurrent reservations and cost an extra round-trip.
+        try:
+            return super().create(request, *args, **kwargs)
+        except IntegrityError:
+            return Response(
+                {"detail": "Seat is already reserved."},
+                status=status.HTTP_409_CONFLICT
+            )
+
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
     def get_queryset(self):
-        return SeatReservation.objects.filter(user=self.request.user)
+        return SeatReservation.objects.filter(user=self.request.user).select_related(
+            'seat', 'movie_schedule__movie', 'movie_schedule__screen__cinema', 'user'
+        ).defer('session_key')
@@ -0,0 +1,207 @@
+# Generated by Django 5.2.4 on 2026-08-31 18:21
+
+import django.core.validators
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Cinema',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200, verbose_name='Cinema Name')),
+                ('address', models.TextField(verbose_name='Address')),
+                ('city', models.CharField(max_length=100, verbose_name='City')),
+                ('phone', models.CharField(blank=True, max_length=20, verbose_name='Phone Number')),
+                ('email', models.EmailField(blank=True, max_length=254, verbose_name='Contact Email')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Active')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Cinema',
+                'verbose_name_plural': 'Cinemas',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SeatType',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True, verbose_name='Type Name')),
+                ('description', models.TextField(blank=True, verbose_name='Description')),
+                ('base_price', models.DecimalField(decimal_places=2, max_digits=8, validators=[django.core.validators.MinValueValidator(0)], verbose_name='Base Price')),
+                ('color_code', models.CharField(default='#4CAF50', help_text='Hexadecimal color code for UI', max_length=7, verbose_name='Color Code')),
+                ('is_premium', models.BooleanField(default=False, verbose_name='Is Premium')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Seat Type',
+                'verbose_name_plural': 'Seat Types',
+                'ordering': ['base_price'],
+            },
+        ),
+        migrations.AlterModelOptions(
+            name='movie',
+            options={'ordering': ['-release_date']},
+        ),
+        migrations.AlterModelOptions(
+            name='movieschedule',
+            options={'ordering': ['start_time']},
+        ),
+        migrations.AddField(
+            model_name='movie',
+            name='content_rating',
+            field=models.CharField(choices=[('G', 'General Audiences'), ('PG', 'Parental Guidance'), ('PG-13', 'Parents Strongly Cautioned'), ('R', 'Restricted'), ('NC-17', 'Adults Only')], default='G', max_length=10, verbose_name='Content Rating'),
+        ),
+        migrations.AddField(
+            model_name='movie',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='movie',
+            name='is_active',
+            field=models.BooleanField(default=True, verbose_name='Active'),
+        ),
+        migrations.AddField(
+            model_name='movie',
+            name='trailer_url',
+            field=models.URLField(blank=True, verbose_name='Trailer URL'),
+        ),
+        migrations.AddField(
+            model_name='movie',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='movieschedule',
+            name='base_price',
+            field=models.DecimalField(decimal_places=2, default=0, help_text='Base price multiplied by seat type price', max_digits=8, validators=[django.core.validators.MinValueValidator(0)], verbose_name='Base Price'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='movieschedule',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='movieschedule',
+            name='is_active',
+            field=models.BooleanField(default=True, verbose_name='Active'),
+        ),
+        migrations.AlterField(
+            model_name='genre',
+            name='name',
+            field=models.CharField(max_length=50, verbose_name='Genre Name'),
+        ),
+        migrations.AlterField(
+            model_name='movie',
+            name='description',
+            field=models.TextField(verbose_name='Description'),
+        ),
+        migrations.AlterField(
+            model_name='movie',
+            name='duration_minutes',
+            field=models.PositiveIntegerField(verbose_name='Duration (minutes)'),
+        ),
+        migrations.AlterField(
+            model_name='movie',
+            name='poster_image',
+            field=models.URLField(blank=True, verbose_name='Poster Image URL'),
+        ),
+        migrations.AlterField(
+            model_name='movie',
+            name='rating',
+            field=models.DecimalField(decimal_places=1, help_text='Rating from 0 to 10', max_digits=3, validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(10)], verbose_name='Rating'),
+        ),
+        migrations.AlterField(
+            model_name='movie',
+            name='release_date',
+            field=models.DateField(verbose_name='Release Date'),
+        ),
+        migrations.AlterField(
+            model_name='movie',
+            name='title',
+            field=models.CharField(max_length=255, verbose_name='Movie Title'),
+        ),
+        migrations.AlterField(
+            model_name='movieschedule',
+            name='end_time',
+            field=models.DateTimeField(verbose_name='End Time'),
+        ),
+        migrations.AlterField(
+            model_name='movieschedule',
+            name='start_time',
+            field=models.DateTimeField(verbose_name='Start Time'),
+        ),
+        migrations.CreateModel(
+            name='Screen',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, verbose_name='Screen Name')),
+                ('screen_number', models.PositiveIntegerField(verbose_name='Screen Number')),
+                ('screen_type', models.CharField(choices=[('standard', 'Standard'), ('imax', 'IMAX'), ('4dx', '4DX'), ('vip', 'VIP'), ('premium', 'Premium')], default='standard', max_length=20, verbose_name='Screen Type')),
+                ('total_rows', models.PositiveIntegerField(validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(50)], verbose_name='Total Rows')),
+                ('seats_per_row', models.PositiveIntegerField(validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(100)], verbose_name='Seats per Row')),
+                ('has_accessibility', models.BooleanField(default=True, verbose_name='Wheelchair Accessibility')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Active')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('cinema', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='screens', to='movies.cinema', verbose_name='Cinema')),
+            ],
+            options={
+                'verbose_name': 'Screen',
+                'verbose_name_plural': 'Screens',
+                'ordering': ['cinema', 'screen_number'],
+                'unique_together': {('cinema', 'screen_number')},
+            },
+        ),
+        migrations.AddField(
+            model_name='movieschedule',
+            name='screen',
+            field=models.ForeignKey(default=0, on_delete=django.db.models.deletion.CASCADE, related_name='schedules', to='movies.screen', verbose_name='Screen'),
+            preserve_default=False,
+        ),
+        migrations.AlterUniqueTogether(
+            name='movieschedule',
+            unique_together={('screen', 'start_time')},
+        ),
+        migrations.RemoveField(
+            model_name='movieschedule',
+            name='screen_number',
+        ),
+        migrations.CreateModel(
+            name='Seat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('row', models.CharField(max_length=5, verbose_name='Row')),
+                ('seat_number', models.CharField(max_length=10, verbose_name='Seat Number')),
+                ('is_accessible', models.BooleanField(default=False, verbose_name='Wheelchair Accessible')),
+                ('is_couple_seat', models.BooleanField(default=False, verbose_name='Couple/Love Seat')),
+                ('status', models.CharField(choices=[('available', 'Available'), ('occupied', 'Occupied'), ('maintenance', 'Maintenance'), ('blocked', 'Blocked')], default='available', max_length=20, verbose_name='Status')),
+                ('position_x', models.PositiveIntegerField(help_text='X position in the theater layout', verbose_name='Position X')),
+                ('position_y', models.PositiveIntegerField(help_text='Y position in the theater layout', verbose_name='Position Y')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('screen', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='seats', to='movies.screen', verbose_name='Screen')),
+                ('seat_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='seats', to='movies.seattype', verbose_name='Seat Type')),
+            ],
+            options={
+                'verbose_name': 'Seat',
+                'verbose_name_plural': 'Seats',
+                'ordering': ['screen', 'row', 'seat_number'],
+                'unique_together': {('screen', 'position_x', 'position_y'), ('screen', 'row', 'seat_number')},
+            },
+        ),
+    ]
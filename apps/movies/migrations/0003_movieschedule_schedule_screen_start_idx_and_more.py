@@ -0,0 +1,21 @@
+# Generated by Django 5.2.4 on 2026-08-31 18:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0002_cinema_seattype_alter_movie_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='movieschedule',
+            index=models.Index(fields=['screen', 'start_time'], name='schedule_screen_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='seat',
+            index=models.Index(fields=['screen', 'status'], name='seat_screen_status_idx'),
+        ),
+    ]
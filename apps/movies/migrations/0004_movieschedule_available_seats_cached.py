@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-08-31 18:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0003_movieschedule_schedule_screen_start_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movieschedule',
+            name='available_seats_cached',
+            field=models.PositiveIntegerField(default=0, verbose_name='Available Seats (cached)'),
+        ),
+    ]
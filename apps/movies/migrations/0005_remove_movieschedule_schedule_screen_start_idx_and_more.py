@@ -0,0 +1,29 @@
+# Generated by Django 5.2.4 on 2026-08-31 18:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0004_movieschedule_available_seats_cached'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='movieschedule',
+            name='schedule_screen_start_idx',
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-release_date'], name='movie_active_release_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='movieschedule',
+            index=models.Index(fields=['screen', 'start_time', 'end_time'], name='sched_overlap_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='movieschedule',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['start_time'], name='sched_active_start_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.4 on 2026-08-31 18:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0005_remove_movieschedule_schedule_screen_start_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='seat',
+            constraint=models.CheckConstraint(condition=models.Q(('position_x__gte', 1)), name='seat_posx_min'),
+        ),
+        migrations.AddConstraint(
+            model_name='seat',
+            constraint=models.CheckConstraint(condition=models.Q(('position_y__gte', 1)), name='seat_posy_min'),
+        ),
+    ]
@@ -41,7 +41,8 @@ class Cinema(models.Model):
         return self.screens.count()
 
     def total_capacity(self):
-        return sum(screen.total_seats() for screen in self.screens.all())
+        # One COUNT across the cinema's seats instead of a COUNT per screen.
+        return Seat.objects.filter(screen__cinema=self).count()
 
 
 class Screen(models.Model):
@@ -101,42 +102,70 @@ class Screen(models.Model):
     def __str__(self):
         return f"{self.cinema.name} - Screen {self.screen_number}"
 
-    def clean(self):
-        if self.cinema_id:
-            existing = Screen.objects.filter(
-                cinema=self.cinema,
-                screen_number=self.screen_number
-            ).exclude(pk=self.pk)
-            
-            if existing.exists():
-                raise ValidationError(
-                    f'Screen {self.screen_number} already exists in {self.cinema.name}'
-                )
-
     def total_seats(self):
         return self.seats.count()
 
+    def generate_seats(self, default_seat_type):
+        """Create the full seat grid for this screen in one INSERT.
+
+        Cinema setup used to be the one place that inserted seats row by
+        row; a single multi-row bulk_create replaces rows*cols statements.
+        ignore_conflicts makes the call safe to re-run — existing seats
+        are left alone under the unique (screen, row, seat_number) and
+        (screen, position_x, position_y) constraints.
+        """
+        from . import seatmap
+
+        seats = [
+            Seat(
+                screen=self,
+                seat_type=default_seat_type,
+                row=chr(ord('A') + y),
+                seat_number=str(x + 1),
+                position_x=x + 1,
+                position_y=y + 1
+            )
+            for y in range(self.total_rows)
+            for x in range(self.seats_per_row)
+        ]
+        created = Seat.objects.bulk_create(
+            seats, batch_size=1000, ignore_conflicts=True
+        )
+        # bulk_create skips post_save signals, so drop the cached layout
+        # by hand.
+        seatmap.invalidate_seatmap(self.pk)
+        # Schedules created before their screen had seats were seeded
+        # with a zero counter; recompute now that the grid exists.
+        for schedule in self.schedules.all():
+            schedule.refresh_available_seats()
+        return created
+
     def available_seats_for_schedule(self, movie_schedule):
         """Get available seats for a specific schedule"""
         from apps.bookings.models import BookedSeat, SeatReservation
+        from django.db.models import Exists, OuterRef
         from django.utils import timezone
-        
-        # Already booked/purchased seats
-        booked_seats = BookedSeat.objects.filter(
+
+        # Correlated NOT EXISTS subqueries: the whole booked/reserved union
+        # stays in the database instead of being shipped back as id lists
+        # and re-sent in an IN clause.
+        booked = BookedSeat.objects.filter(
+            seat=OuterRef('pk'),
             booking__movie_schedule=movie_schedule,
             booking__booking_status__in=['CONFIRMED', 'PENDING']
-        ).values_list('seat__id', flat=True)
-        
-        # Temporarily reserved seats (last 15 minutes)
-        reserved_seats = SeatReservation.objects.filter(
+        )
+        reserved = SeatReservation.objects.filter(
+            seat=OuterRef('pk'),
             movie_schedule=movie_schedule,
             reserved_until__gte=timezone.now()
-        ).values_list('seat__id', flat=True)
-        
-        # Combine both sets
-        unavailable_seat_ids = set(booked_seats) | set(reserved_seats)
-        
-        return self.seats.exclude(id__in=unavailable_seat_ids)
+        )
+        return self.seats.annotate(
+            _booked=Exists(booked),
+            _reserved=Exists(reserved),
+            # Price resolved in the same query — callers never touch the
+            # seat_type FK per seat.
+            current_price=models.F('seat_type__base_price')
+        ).filter(_booked=False, _reserved=False)
 
 
 class SeatType(models.Model):
@@ -242,16 +271,41 @@ class Seat(models.Model):
             ['screen', 'position_x', 'position_y']
         ]
         ordering = ['screen', 'row', 'seat_number']
+        indexes = [
+            # Availability scans filter a screen's seats by status.
+            models.Index(
+                fields=['screen', 'status'],
+                name='seat_screen_status_idx'
+            )
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(position_x__gte=1),
+                name='seat_posx_min'
+            ),
+            models.CheckConstraint(
+                check=models.Q(position_y__gte=1),
+                name='seat_posy_min'
+            )
+        ]
 
     def __str__(self):
         return f"{self.screen} - {self.row}{self.seat_number}"
 
     def clean(self):
-        # Validate seat is within screen limits
-        if self.position_x > self.screen.seats_per_row:
+        # Only validate against the screen limits when the screen is
+        # already in memory — fetching it here cost one SELECT per seat
+        # save during screen setup. The positive-position CHECK
+        # constraints hold unconditionally, and bulk paths
+        # (Screen.generate_seats) never call clean() at all.
+        screen = self._state.fields_cache.get('screen')
+        if screen is None:
+            return
+
+        if self.position_x > screen.seats_per_row:
             raise ValidationError('Position X exceeds seats per row')
-        
-        if self.position_y > self.screen.total_rows:
+
+        if self.position_y > screen.total_rows:
             raise ValidationError('Position Y exceeds total rows')
 
     def is_available_for_schedule(self, movie_schedule):
@@ -283,11 +337,17 @@ class Seat(models.Model):
 
     def get_price_for_schedule(self, movie_schedule):
         """Calculate seat price for a specific schedule"""
+        # Annotated querysets (available_seats_for_schedule) resolve the
+        # price in SQL; only cold instances walk the seat_type FK.
+        current_price = getattr(self, 'current_price', None)
+        if current_price is not None:
+            return current_price
+
         base_price = self.seat_type.base_price
-        
+
         # Here you can add dynamic pricing logic
         # For example, peak hours, weekends, etc.
-        
+
         return base_price
 
 
@@ -344,6 +404,15 @@ class Movie(models.Model):
 
     class Meta:
         ordering = ['-release_date']
+        indexes = [
+            # Catalogue listings only ever show active movies; the partial
+            # index stays small and satisfies the default ordering.
+            models.Index(
+                fields=['-release_date'],
+                name='movie_active_release_idx',
+                condition=models.Q(is_active=True)
+            )
+        ]
 
     def __str__(self):
         return self.title
@@ -386,9 +455,31 @@ class MovieSchedule(models.Model):
     is_active = models.BooleanField("Active", default=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Counter cache maintained by booking/reservation signals; listing
+    # pages read this column instead of re-running the seats × bookings ×
+    # reservations aggregation per schedule.
+    available_seats_cached = models.PositiveIntegerField(
+        "Available Seats (cached)",
+        default=0
+    )
+
     class Meta:
         ordering = ['start_time']
         unique_together = ['screen', 'start_time']
+        indexes = [
+            # Per-screen timetable scans; end_time included so the
+            # clean() overlap probe is answered from the index alone.
+            models.Index(
+                fields=['screen', 'start_time', 'end_time'],
+                name='sched_overlap_idx'
+            ),
+            # Public listings filter is_active and order by start_time.
+            models.Index(
+                fields=['start_time'],
+                name='sched_active_start_idx',
+                condition=models.Q(is_active=True)
+            )
+        ]
 
     def __str__(self):
         return f"{self.movie.title} - {self.screen} @ {self.start_time.strftime('%Y-%m-%d %H:%M')}"
@@ -410,10 +501,22 @@ class MovieSchedule(models.Model):
                     f'that overlaps with this time slot'
                 )
 
+    def save(self, *args, **kwargs):
+        if self._state.adding and self.screen_id and not self.available_seats_cached:
+            self.available_seats_cached = self.screen.total_seats()
+        super().save(*args, **kwargs)
+
     def is_upcoming(self):
         from django.utils import timezone
         return self.start_time > timezone.now()
 
+    def refresh_available_seats(self):
+        """Recompute the counter cache from the live availability query."""
+        self.available_seats_cached = (
+            self.screen.available_seats_for_schedule(self).count()
+        )
+        self.save(update_fields=['available_seats_cached'])
+
     def duration_minutes(self):
         if self.start_time and self.end_time:
             return int((self.end_time - self.start_time).total_seconds() / 60)
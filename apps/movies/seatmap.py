@@ -0,0 +1,66 @@
+from django.core.cache import cache
+from django.utils import timezone
+
+from .models import Seat
+
+SEATMAP_CACHE_SECONDS = 60 * 60
+
+
+def _seatmap_key(screen_id):
+    return f'seatmap:{screen_id}'
+
+
+def get_seatmap(screen_id):
+    """Return the static seat layout for a screen, cached for an hour.
+
+    The layout (positions, rows, seat types, base prices) only changes
+    when the theatre is refitted, yet every booking page load used to
+    refetch it with the seat_type join. Cache misses run one values()
+    query; Seat saves/deletes drop the key (see signals.py).
+    """
+    return cache.get_or_set(
+        _seatmap_key(screen_id),
+        lambda: list(
+            Seat.objects.filter(screen_id=screen_id).values(
+                'id', 'row', 'seat_number', 'position_x', 'position_y',
+                'status', 'seat_type__name', 'seat_type__base_price'
+            )
+        ),
+        SEATMAP_CACHE_SECONDS
+    )
+
+
+def invalidate_seatmap(screen_id):
+    cache.delete(_seatmap_key(screen_id))
+
+
+def get_seatmap_with_availability(movie_schedule):
+    """Seat layout for a schedule's screen with per-seat availability.
+
+    Only the small unavailable-id set is queried per request; the layout
+    itself comes from the cache.
+    """
+    from apps.bookings.models import BookedSeat, SeatReservation
+
+    unavailable = set(
+        BookedSeat.objects.filter(
+            booking__movie_schedule=movie_schedule,
+            booking__booking_status__in=['CONFIRMED', 'PENDING']
+        ).values_list('seat_id', flat=True)
+    )
+    unavailable.update(
+        SeatReservation.objects.filter(
+            movie_schedule=movie_schedule,
+            reserved_until__gte=timezone.now()
+        ).values_list('seat_id', flat=True)
+    )
+
+    return [
+        {
+            **seat,
+            'is_available': (
+                seat['status'] == 'available' and seat['id'] not in unavailable
+            )
+        }
+        for seat in get_seatmap(movie_schedule.screen_id)
+    ]
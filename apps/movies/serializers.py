@@ -2,19 +2,18 @@ from rest_framework import serializers
 from .models import Genre, Movie, MovieSchedule
 
 class GenreSerializer(serializers.ModelSerializer):
-    movie_count = serializers.SerializerMethodField()
+    movie_count = serializers.ReadOnlyField()
 
     class Meta:
         model = Genre
         fields = ['id', 'name', 'movie_count']
 
-    def get_movie_count(self, obj):
-        return obj.movie_count()
-
 
 class MovieSerializer(serializers.ModelSerializer):
-    genre_names = serializers.SerializerMethodField()
-    duration_in_hours = serializers.SerializerMethodField()
+    # ReadOnlyField calls the model methods directly; genre_names() reads
+    # from the viewset's prefetch cache, so neither costs a query per row.
+    genre_names = serializers.ReadOnlyField()
+    duration_in_hours = serializers.ReadOnlyField()
 
     class Meta:
         model = Movie
@@ -30,17 +29,30 @@ class MovieSerializer(serializers.ModelSerializer):
             'poster_image'
         ]
 
-    def get_genre_names(self, obj):
-        return obj.genre_names()
 
-    def get_duration_in_hours(self, obj):
-        return obj.duration_in_hours()
+
+class MovieListSerializer(MovieSerializer):
+    # List pages never show the synopsis; leaving description out keeps
+    # the heaviest column off the wire entirely.
+    class Meta(MovieSerializer.Meta):
+        fields = [
+            field for field in MovieSerializer.Meta.fields
+            if field != 'description'
+        ]
 
 
 class MovieScheduleSerializer(serializers.ModelSerializer):
-    is_upcoming = serializers.SerializerMethodField()
+    is_upcoming = serializers.ReadOnlyField()
     duration_minutes = serializers.SerializerMethodField()
     movie_title = serializers.CharField(source='movie.title', read_only=True)
+    # screen_number lives on the related Screen; sourcing it through the
+    # relation rides the viewset's select_related('screen').
+    screen_number = serializers.IntegerField(source='screen.screen_number', read_only=True)
+    # Counter cache column — O(1) per row versus the joined COUNT the
+    # model method runs.
+    available_seats_count = serializers.IntegerField(
+        source='available_seats_cached', read_only=True
+    )
 
     class Meta:
         model = MovieSchedule
@@ -50,13 +62,14 @@ class MovieScheduleSerializer(serializers.ModelSerializer):
             'movie_title', 
             'start_time', 
             'end_time', 
-            'screen_number', 
-            'is_upcoming', 
-            'duration_minutes'
+            'screen_number',
+            'is_upcoming',
+            'duration_minutes',
+            'available_seats_count'
         ]
 
-    def get_is_upcoming(self, obj):
-        return obj.is_upcoming()
-
     def get_duration_minutes(self, obj):
-        return int(obj.duration())
\ No newline at end of file
+        duration = getattr(obj, 'duration', None)
+        if duration is not None:
+            return int(duration.total_seconds() // 60)
+        return obj.duration_minutes()
\ No newline at end of file
@@ -0,0 +1,23 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import seatmap
+from .models import Genre, Movie, Seat
+
+
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+@receiver(post_save, sender=Movie)
+@receiver(post_delete, sender=Movie)
+def invalidate_catalog_cache(sender, **kwargs):
+    # cache_page keys are opaque and the default backend has no pattern
+    # delete, so drop the whole cache. Catalogue writes are rare enough
+    # that a full flush is cheaper than stale movie listings.
+    cache.clear()
+
+
+@receiver(post_save, sender=Seat)
+@receiver(post_delete, sender=Seat)
+def invalidate_seatmap_cache(sender, instance, **kwargs):
+    seatmap.invalidate_seatmap(instance.screen_id)
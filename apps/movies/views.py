@@ -1,18 +1,100 @@
+from django.db.models import DurationField, ExpressionWrapper, F, Prefetch
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
 from rest_framework import viewsets, permissions
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
 from .models import Genre, Movie, MovieSchedule
-from .serializers import GenreSerializer, MovieSerializer, MovieScheduleSerializer
+from .serializers import (
+    GenreSerializer,
+    MovieSerializer,
+    MovieListSerializer,
+    MovieScheduleSerializer
+)
 
+# Genres and the movie catalogue change rarely; serve their public
+# read-only endpoints from the page cache. Saves on Genre/Movie clear the
+# cache (see signals.py), so the TTL is just a backstop.
+CATALOG_CACHE_SECONDS = 60 * 15
+
+
+@method_decorator(cache_page(CATALOG_CACHE_SECONDS), name='list')
+@method_decorator(cache_page(CATALOG_CACHE_SECONDS), name='retrieve')
 class GenreViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = Genre.objects.all()
     serializer_class = GenreSerializer
     permission_classes = [permissions.AllowAny]
 
+@method_decorator(cache_page(CATALOG_CACHE_SECONDS), name='list')
+@method_decorator(cache_page(CATALOG_CACHE_SECONDS), name='retrieve')
 class MovieViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Movie.objects.select_related().prefetch_related('genres').all()
+    queryset = Movie.objects.all()
     serializer_class = MovieSerializer
     permission_classes = [permissions.AllowAny]
 
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return MovieListSerializer
+        return MovieSerializer
+
+    def get_queryset(self):
+        # Genres are only ever read for their names here; a narrowed
+        # prefetch keeps the single IN query but skips hydrating unused
+        # columns. only() trims the movie row to what gets rendered —
+        # description, the widest column, is loaded for detail pages only.
+        fields = [
+            'id', 'title', 'duration_minutes', 'release_date',
+            'rating', 'poster_image'
+        ]
+        if self.action != 'list':
+            fields.append('description')
+        return Movie.objects.only(*fields).prefetch_related(
+            Prefetch('genres', queryset=Genre.objects.only('id', 'name'))
+        )
+
+    def list(self, request, *args, **kwargs):
+        # Hand-rolled list rendering: builds the same dicts
+        # MovieListSerializer would produce without per-row field binding
+        # and to_representation dispatch. Detail responses keep the
+        # serializer.
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        data = [
+            {
+                'id': movie.id,
+                'title': movie.title,
+                'duration_minutes': movie.duration_minutes,
+                'duration_in_hours': movie.duration_in_hours(),
+                'release_date': movie.release_date.isoformat(),
+                'rating': str(movie.rating),
+                'genre_names': movie.genre_names(),
+                'poster_image': movie.poster_image
+            }
+            for movie in (page if page is not None else queryset)
+        ]
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+class SchedulePagination(CursorPagination):
+    # Keyset pagination over the indexed start_time: each page is a
+    # constant-time index seek instead of an O(offset) scan. id breaks
+    # ties since several screens can share a start time.
+    ordering = ('start_time', 'id')
+    page_size = 50
+
+
 class MovieScheduleViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = MovieSchedule.objects.select_related('movie').all()
+    pagination_class = SchedulePagination
+    # Duration is a pure function of two columns, so compute it in SQL once
+    # per row instead of subtracting datetimes in Python per schedule.
+    queryset = MovieSchedule.objects.filter(is_active=True).select_related(
+        'movie', 'screen', 'screen__cinema'
+    ).annotate(
+        duration=ExpressionWrapper(
+            F('end_time') - F('start_time'),
+            output_field=DurationField()
+        )
+    )
     serializer_class = MovieScheduleSerializer
     permission_classes = [permissions.AllowAny]
@@ -0,0 +1,18 @@
+from rest_framework.renderers import JSONRenderer
+
+import orjson
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSON renderer backed by orjson.
+
+    orjson serializes datetimes, dates and UUIDs natively and is a multiple
+    faster than the stdlib encoder on large list responses; remaining types
+    the encoder does not know (notably Decimal) fall back to str(), matching
+    DRF's default string representation for DecimalField.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=str)